@@ -4,20 +4,74 @@ XAMPP Control Panel for Linux
 A GUI application to control XAMPP services on Linux systems.
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import subprocess
-import threading
 import os
 import sys
+
+# Detach from terminal only when asked, before tkinter is loaded
+if "--daemon" in sys.argv:
+    if os.fork():
+        sys.exit()
+    os.setsid()
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+import subprocess
+import shutil
+import asyncio
+import signal
+import traceback
+import io
+import codecs
+import locale
+import glob
+import socket
+import webbrowser
 from datetime import datetime
 
-# Detach from terminal
-if os.fork():
-    sys.exit()
-os.setsid()
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Fall back to scanning /proc directly
+
+# Process names (as in /proc/<pid>/comm) for each service
+SERVICE_PROCESSES = {
+    "httpd": "apache",
+    "mysqld": "mysql",
+    "proftpd": "ftp",
+}
+
+# lampp actions the control panel can run
+ACTIONS = (
+    "start", "stop", "restart", "reload",
+    "startapache", "stopapache",
+    "startmysql", "stopmysql",
+    "startftp", "stopftp",
+)
+
+# Interval between automatic service status refreshes
+STATUS_REFRESH_MS = 5000
+
+# Remembers the detected authentication method between launches
+AUTH_CACHE_FILE = os.path.expanduser("~/.config/xampp-control/auth")
+
+# Host name used by MySQL/MariaDB for its error log file
+HOSTNAME = socket.gethostname()
+
+# Error log viewer limits
+LOG_CHUNK_SIZE = 64 * 1024
+LOG_TAIL_BYTES = 2 * 1024 * 1024
+
+# Command output and log files are decoded the same way, using the locale
+TEXT_ENCODING = locale.getpreferredencoding(False)
+
+# Output log size: once over the limit, the oldest lines are dropped in bulk
+LOG_MAX_LINES = 2000
+LOG_TRIM_LINES = 500
 
 class XAMPPController:
+    # Auth method detection results, shared so re-detection is free
+    _auth_cache = {}
+
     def __init__(self, root):
         self.root = root
         self.root.title("XAMPP Control Panel")
@@ -38,31 +92,114 @@ class XAMPPController:
         # Check for available privilege escalation methods
         self.auth_method = self.detect_auth_method()
         
+        # Commands only depend on the auth method, so build them once
+        self._cmd_table = {action: self._build_cmd(action) for action in ACTIONS}
+        self._cmd_str = {action: " ".join(cmd) for action, cmd in self._cmd_table.items()}
+        
+        # Event loop for service actions, driven from the Tk main loop
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._tasks = set()  # Strong references to running tasks
+        
+        # Status refresh coalescing, only touched from the Tk thread
+        self._refresh_pending = False
+        self._refresh_queued = False
+        
         # Configure styles for toggle buttons
         style = ttk.Style()
         style.configure("Start.TButton", foreground="green")
         style.configure("Stop.TButton", foreground="red")
         
+        # Shared tooltip window, created on first hover and then reused
+        self._tooltip = None
+        self._tip_label = None
+        
         self.setup_ui()
         self.log_message(f"Using authentication method: {self.auth_method}")
-        self.update_status()
+        self._tick()
+        self._auto_refresh()
+        
+    def _tick(self):
+        """Run pending asyncio callbacks, then reschedule"""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.root.after(20, self._tick)
+        
+    def _spawn(self, coro):
+        """Schedule a coroutine on the event loop and keep it referenced"""
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+        
+    def _task_done(self, task):
+        """Drop a finished task and report any exception it raised"""
+        self._tasks.discard(task)
+        if task.cancelled() or task.exception() is None:
+            return
+        exc = task.exception()
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+        try:
+            self.log_message(f"Task failed: {str(exc)}")
+        except tk.TclError:
+            pass  # Window is already gone
+        
+    def shutdown(self):
+        """Cancel pending tasks and close the event loop"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            self.loop.run_until_complete(
+                asyncio.gather(*self._tasks, return_exceptions=True))
+        self.loop.close()
         
     def detect_auth_method(self):
         """Detect the best available authentication method"""
+        if self.xampp_script in self._auth_cache:
+            return self._auth_cache[self.xampp_script]
+        
         methods = {
             'direct': lambda: os.access(self.xampp_script, os.X_OK),
-            'gksu': lambda: subprocess.run(['which', 'gksu'], capture_output=True).returncode == 0,
-            'pkexec': lambda: subprocess.run(['which', 'pkexec'], capture_output=True).returncode == 0,
-            'sudo': lambda: subprocess.run(['which', 'sudo'], capture_output=True).returncode == 0,
+            'gksu': lambda: shutil.which('gksu') is not None,
+            'pkexec': lambda: shutil.which('pkexec') is not None,
+            'sudo': lambda: shutil.which('sudo') is not None,
         }
         
+        # Reuse the method saved by a previous launch for this install if it still works
+        try:
+            with open(AUTH_CACHE_FILE, "r") as f:
+                script, _, cached = f.read().strip().rpartition(":")
+            if (script == self.xampp_script and cached in methods and methods[cached]()
+                    and (cached != 'direct' or os.geteuid() == 0)):
+                self._auth_cache[self.xampp_script] = cached
+                return cached
+        except OSError:
+            pass
+        
+        detected = 'sudo'  # fallback
         for method, check in methods.items():
             try:
                 if check():
-                    return method
+                    detected = method
+                    break
             except:
                 continue
-        return 'sudo'  # fallback
+        
+        try:
+            if detected == 'direct' and os.geteuid() != 0:
+                # lampp refuses non-root users, so don't pin a method that
+                # only works through the pkexec fallback
+                if os.path.exists(AUTH_CACHE_FILE):
+                    os.remove(AUTH_CACHE_FILE)
+            else:
+                os.makedirs(os.path.dirname(AUTH_CACHE_FILE), exist_ok=True)
+                with open(AUTH_CACHE_FILE, "w") as f:
+                    f.write(f"{self.xampp_script}:{detected}")
+        except OSError:
+            pass  # Detection simply runs again next launch
+        
+        self._auth_cache[self.xampp_script] = detected
+        return detected
         
     def setup_ui(self):
         # Main frame with reduced padding
@@ -174,12 +311,16 @@ class XAMPPController:
         log_frame.rowconfigure(0, weight=1)
         
         # Log text area - bigger by default
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70, font=("Courier", 9))
+        self.log_text = tk.Text(log_frame, height=15, width=70, font=("Courier", 9))
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.log_text.config(yscrollcommand=log_scrollbar.set)
+        
         # Log controls frame
         log_controls = ttk.Frame(log_frame)
-        log_controls.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        log_controls.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
         log_controls.columnconfigure(0, weight=1)
         
         ttk.Button(log_controls, text="Clear Log", 
@@ -191,18 +332,19 @@ class XAMPPController:
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget"""
         def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = ttk.Label(tooltip, text=text, background="lightyellow", 
-                            relief="solid", borderwidth=1, font=("Arial", 9))
-            label.pack()
-            widget.tooltip = tooltip
+            if self._tooltip is None:
+                self._tooltip = tk.Toplevel(self.root)
+                self._tooltip.wm_overrideredirect(True)
+                self._tip_label = ttk.Label(self._tooltip, background="lightyellow",
+                                            relief="solid", borderwidth=1, font=("Arial", 9))
+                self._tip_label.pack()
+            self._tip_label.config(text=text)
+            self._tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            self._tooltip.deiconify()
         
         def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                delattr(widget, 'tooltip')
+            if self._tooltip is not None:
+                self._tooltip.withdraw()
         
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
@@ -223,12 +365,18 @@ class XAMPPController:
                 self.service_buttons[service].config(text="Start", style="Start.TButton")
         self.service_status[service] = is_running
         
-    def log_message(self, message):
-        """Add message to log with timestamp"""
+    def log_message(self, *messages):
+        """Add messages to log with timestamp in a single insert"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        self.log_text.insert(tk.END, "".join(f"[{timestamp}] {message}\n" for message in messages))
+        
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES:
+            excess = line_count - LOG_MAX_LINES + LOG_TRIM_LINES
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+        
         self.log_text.see(tk.END)
-        self.root.update()
+        self.log_text.update_idletasks()
         
     def clear_log(self):
         """Clear the log text"""
@@ -254,58 +402,92 @@ class XAMPPController:
             self.log_message(f"Error running command: {str(e)}")
             return False, "", str(e)
     
-    def run_xampp_command(self, action):
-        """Run XAMPP command with alternative methods"""
-        # Try multiple approaches in order
-        methods = [
-            # Method 1: Direct execution (if user has permissions)
-            [self.xampp_script, action],
-            # Method 2: sudo without password prompt  
-            ["sudo", "-n", self.xampp_script, action],
-            # Method 3: pkexec (will prompt for password)
-            ["pkexec", self.xampp_script, action],
-            # Method 4: su with timeout
-            ["timeout", "1", "sudo", self.xampp_script, action],
-        ]
-        
-        for i, command in enumerate(methods):
+    def _build_cmd(self, action, method=None):
+        """Build the command line for an action and authentication method"""
+        return {
+            'direct': [self.xampp_script, action],
+            'gksu': ["gksu", self.xampp_script, action],
+            'pkexec': ["pkexec", self.xampp_script, action],
+            'sudo': ["sudo", "-n", self.xampp_script, action],
+        }[method or self.auth_method]
+    
+    async def run_xampp_command(self, action):
+        """Run XAMPP command using the detected authentication method"""
+        command = self._cmd_table.get(action) or self._build_cmd(action)
+        success, stdout, stderr = await self._run_xampp(command, self._cmd_str.get(action))
+        
+        # Fall back to an interactive pkexec prompt when elevation is missing.
+        # lampp exits 0 after printing its root check, so match the text alone.
+        output = f"{stdout}\n{stderr}".lower()
+        if "a password is required" in output or "need to be root" in output:
+            success = False
+            if self.auth_method != 'pkexec' and shutil.which('pkexec'):
+                self.log_message("Insufficient privileges, retrying with pkexec")
+                success, stdout, stderr = await self._run_xampp(self._build_cmd(action, 'pkexec'))
+        
+        return success, stdout, stderr
+    
+    async def _run_xampp(self, command, command_str=None):
+        """Run a single XAMPP command and return the result"""
+        try:
+            self.log_message(f"Running: {command_str or ' '.join(command)}")
+            # Own session so a timeout can take down lampp's children as well
+            proc = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                start_new_session=True)
+            stdout_lines, stderr_lines = [], []
             try:
-                self.log_message(f"Trying method {i+1}: {' '.join(command)}")
-                result = subprocess.run(command, capture_output=True, text=True, timeout=30)
-                
-                if result.returncode == 0:
-                    if result.stdout:
-                        self.log_message(f"Output: {result.stdout.strip()}")
-                    return True, result.stdout, result.stderr
-                elif i < len(methods) - 1:  # Not the last method
-                    self.log_message(f"Method {i+1} failed, trying next...")
-                    continue
-                else:
-                    if result.stderr:
-                        self.log_message(f"Error: {result.stderr.strip()}")
-                    return False, result.stdout, result.stderr
-                    
-            except subprocess.TimeoutExpired:
-                self.log_message(f"Method {i+1} timed out")
-                if i == len(methods) - 1:
-                    return False, "", "All methods timed out"
-                continue
-            except Exception as e:
-                self.log_message(f"Method {i+1} exception: {str(e)}")
-                if i == len(methods) - 1:
-                    return False, "", str(e)
-                continue
-        
-        return False, "", "All methods failed"
+                await asyncio.wait_for(asyncio.gather(
+                    self._stream_output(proc.stdout, stdout_lines, "Output"),
+                    self._stream_output(proc.stderr, stderr_lines),
+                    proc.wait()), timeout=30)
+            except asyncio.TimeoutError:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    await proc.wait()
+                    self.log_message(f"Command timed out, killed process group {proc.pid}")
+                except OSError as e:
+                    # Elevated commands may not be killable by this user
+                    self.log_message(f"Command timed out, could not kill process group {proc.pid}: {str(e)}")
+                return False, "", "Command timed out"
+            
+            stderr = "\n".join(stderr_lines)
+            if proc.returncode != 0 and stderr.strip():
+                self.log_message(f"Error: {stderr.strip()}")
+            return proc.returncode == 0, "\n".join(stdout_lines), stderr
+        except Exception as e:
+            self.log_message(f"Error running command: {str(e)}")
+            return False, "", str(e)
+    
+    async def _stream_output(self, stream, lines, prefix=None):
+        """Collect a command's output stream, logging complete lines as they arrive"""
+        decoder = codecs.getincrementaldecoder(TEXT_ENCODING)(errors="replace")
+        pending = ""
+        while True:
+            chunk = await stream.read(LOG_CHUNK_SIZE)
+            pending += decoder.decode(chunk, final=not chunk)
+            if chunk:
+                *ready, pending = pending.split("\n")
+            else:
+                ready, pending = ([pending] if pending else []), ""
+            
+            ready = [line.rstrip() for line in ready]
+            lines.extend(ready)
+            # Everything that arrived together goes to the log in one batch
+            messages = [f"{prefix}: {line}" for line in ready if line]
+            if prefix and messages:
+                self.log_message(*messages)
+            if not chunk:
+                break
     
     def start_service(self, service):
         """Start a specific service"""
-        def task():
+        async def task():
             # Disable button during operation
             if service in self.service_buttons:
                 self.service_buttons[service].config(state="disabled")
             
-            success, _, _ = self.run_xampp_command(f"start{service}")
+            success, _, _ = await self.run_xampp_command(f"start{service}")
             if success:
                 self.log_message(f"{service.upper()} started successfully")
             else:
@@ -316,16 +498,16 @@ class XAMPPController:
                 self.service_buttons[service].config(state="normal")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
     
     def stop_service(self, service):
         """Stop a specific service"""
-        def task():
+        async def task():
             # Disable button during operation
             if service in self.service_buttons:
                 self.service_buttons[service].config(state="disabled")
             
-            success, _, _ = self.run_xampp_command(f"stop{service}")
+            success, _, _ = await self.run_xampp_command(f"stop{service}")
             if success:
                 self.log_message(f"{service.upper()} stopped successfully")
             else:
@@ -336,104 +518,159 @@ class XAMPPController:
                 self.service_buttons[service].config(state="normal")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
     
     def restart_service(self, service):
         """Restart a specific service"""
-        def task():
+        async def task():
             self.log_message(f"Restarting {service.upper()}...")
-            self.run_xampp_command(f"stop{service}")
-            self.run_xampp_command(f"start{service}")
+            await self.run_xampp_command(f"stop{service}")
+            await self.run_xampp_command(f"start{service}")
             self.log_message(f"{service.upper()} restarted")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
     
     def start_all(self):
         """Start all XAMPP services"""
-        def task():
-            success, _, _ = self.run_xampp_command("start")
+        async def task():
+            running = await self.loop.run_in_executor(None, self.check_all_services)
+            if all(running.values()):
+                self.log_message("All services already running")
+                return
+            
+            success, _, _ = await self.run_xampp_command("start")
             if success:
                 self.log_message("All services started successfully")
             else:
                 self.log_message("Failed to start all services")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
     
     def stop_all(self):
         """Stop all XAMPP services"""
-        def task():
-            success, _, _ = self.run_xampp_command("stop")
+        async def task():
+            running = await self.loop.run_in_executor(None, self.check_all_services)
+            if not any(running.values()):
+                self.log_message("All services already stopped")
+                return
+            
+            success, _, _ = await self.run_xampp_command("stop")
             if success:
                 self.log_message("All services stopped successfully")
             else:
                 self.log_message("Failed to stop all services")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
     
     def restart_all(self):
         """Restart all XAMPP services"""
-        def task():
-            success, _, _ = self.run_xampp_command("restart")
+        async def task():
+            # Nothing to stop, so a plain start is enough
+            running = await self.loop.run_in_executor(None, self.check_all_services)
+            if any(running.values()):
+                action, done, verb = "restart", "restarted", "restart"
+            else:
+                action, done, verb = "start", "started", "start"
+            success, _, _ = await self.run_xampp_command(action)
             if success:
-                self.log_message("All services restarted successfully")
+                self.log_message(f"All services {done} successfully")
             else:
-                self.log_message("Failed to restart all services")
+                self.log_message(f"Failed to {verb} all services")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
     
     def reload_xampp(self):
         """Reload XAMPP configuration"""
-        def task():
-            success, _, _ = self.run_xampp_command("reload")
+        async def task():
+            success, _, _ = await self.run_xampp_command("reload")
             if success:
                 self.log_message("XAMPP configuration reloaded")
             else:
                 self.log_message("Failed to reload XAMPP configuration")
             self.update_status()
         
-        threading.Thread(target=task, daemon=True).start()
+        self._spawn(task())
+    
+    def _scan_running(self):
+        """Scan /proc once and return the running state of every service"""
+        running = {service: False for service in SERVICE_PROCESSES.values()}
+        try:
+            entries = os.scandir('/proc')
+        except OSError:
+            return running
+        
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/comm", "r") as f:
+                        comm = f.read().strip()
+                except OSError:
+                    # Process exited while scanning or is not readable
+                    continue
+                service = SERVICE_PROCESSES.get(comm)
+                if service:
+                    running[service] = True
+        return running
+    
+    def check_all_services(self):
+        """Return the running state of every service from one process scan"""
+        if psutil is None:
+            return self._scan_running()
+        
+        names = {p.info['name'] for p in psutil.process_iter(['name'])}
+        return {service: name in names for name, service in SERVICE_PROCESSES.items()}
     
     def check_service_status(self, service):
         """Check if a service is running"""
-        try:
-            if service == "apache":
-                result = subprocess.run(["pgrep", "-f", "httpd"], capture_output=True)
-            elif service == "mysql":
-                result = subprocess.run(["pgrep", "-f", "mysqld"], capture_output=True)
-            elif service == "ftp":
-                result = subprocess.run(["pgrep", "-f", "proftpd"], capture_output=True)
-            else:
-                return False
-            
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self.check_all_services().get(service, False)
     
     def update_status(self):
         """Update service status display"""
-        def task():
-            services = ["apache", "mysql", "ftp"]
-            for service in services:
-                if service in self.service_labels:
-                    is_running = self.check_service_status(service)
-                    if is_running:
-                        self.service_labels[service].config(text="Running", foreground="green")
-                    else:
-                        self.service_labels[service].config(text="Stopped", foreground="red")
-                    
-                    # Update toggle button
-                    self.update_toggle_button(service, is_running)
+        if self._refresh_pending:
+            # A scan is already in flight; show the final state once it is done
+            self._refresh_queued = True
+            return
+        self._refresh_pending = True
         
-        threading.Thread(target=task, daemon=True).start()
+        async def task():
+            try:
+                # The /proc scan blocks, so keep it off the Tk thread
+                running = await self.loop.run_in_executor(None, self.check_all_services)
+                for service, is_running in running.items():
+                    if service in self.service_labels:
+                        if is_running:
+                            self.service_labels[service].config(text="Running", foreground="green")
+                        else:
+                            self.service_labels[service].config(text="Stopped", foreground="red")
+                        
+                        # Update toggle button
+                        self.update_toggle_button(service, is_running)
+            finally:
+                self._refresh_pending = False
+                if self._refresh_queued:
+                    self._refresh_queued = False
+                    self.root.after(200, self.update_status)
+        
+        self._spawn(task())
+    
+    def _auto_refresh(self):
+        """Refresh service status periodically"""
+        # Skip this round if a refresh is still running
+        if not self._refresh_pending:
+            self.update_status()
+        self.root.after(STATUS_REFRESH_MS, self._auto_refresh)
     
     def open_localhost(self):
         """Open localhost in default browser"""
         try:
-            subprocess.run(["xdg-open", "http://localhost"], check=True)
+            if not webbrowser.open("http://localhost"):
+                raise RuntimeError("no web browser available")
             self.log_message("Opening localhost in browser")
         except Exception as e:
             self.log_message(f"Failed to open localhost: {str(e)}")
@@ -441,7 +678,8 @@ class XAMPPController:
     def open_phpmyadmin(self):
         """Open phpMyAdmin in default browser"""
         try:
-            subprocess.run(["xdg-open", "http://localhost/phpmyadmin"], check=True)
+            if not webbrowser.open("http://localhost/phpmyadmin"):
+                raise RuntimeError("no web browser available")
             self.log_message("Opening phpMyAdmin in browser")
         except Exception as e:
             self.log_message(f"Failed to open phpMyAdmin: {str(e)}")
@@ -457,6 +695,9 @@ class XAMPPController:
     
     def view_error_logs(self):
         """Open error logs in a new window"""
+        # Only needed here, so keep it out of startup
+        from tkinter import scrolledtext
+        
         log_window = tk.Toplevel(self.root)
         log_window.title("XAMPP Error Logs")
         log_window.geometry("800x600")
@@ -471,24 +712,57 @@ class XAMPPController:
         apache_log = scrolledtext.ScrolledText(apache_frame)
         apache_log.pack(fill=tk.BOTH, expand=True)
         
-        try:
-            with open(f"{self.xampp_path}/logs/error_log", "r") as f:
-                apache_log.insert(tk.END, f.read())
-        except Exception as e:
-            apache_log.insert(tk.END, f"Could not read Apache error log: {str(e)}")
+        self.load_log_file(apache_log, f"{self.xampp_path}/logs/error_log", "Apache")
         
-        # MySQL error log
+        # MySQL error log, built the first time its tab is shown
         mysql_frame = ttk.Frame(notebook)
         notebook.add(mysql_frame, text="MySQL Error Log")
         
-        mysql_log = scrolledtext.ScrolledText(mysql_frame)
-        mysql_log.pack(fill=tk.BOTH, expand=True)
+        def on_tab_changed(event):
+            if notebook.index("current") != 1 or mysql_frame.winfo_children():
+                return
+            mysql_log = scrolledtext.ScrolledText(mysql_frame)
+            mysql_log.pack(fill=tk.BOTH, expand=True)
+            
+            self.load_log_file(mysql_log, self.mysql_error_log_path(), "MySQL")
         
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+    
+    def mysql_error_log_path(self):
+        """Locate the MySQL error log, named after the host by default"""
+        path = f"{self.xampp_path}/var/mysql/{HOSTNAME}.err"
+        if not os.path.exists(path):
+            candidates = glob.glob(f"{self.xampp_path}/var/mysql/*.err")
+            if candidates:
+                # A host rename can leave old logs behind, so show the newest
+                path = max(candidates, key=os.path.getmtime)
+        return path
+    
+    def load_log_file(self, text_widget, path, name):
+        """Stream the tail of a log file into a text widget in chunks"""
         try:
-            with open(f"{self.xampp_path}/var/mysql/$(hostname).err", "r") as f:
-                mysql_log.insert(tk.END, f.read())
+            with open(path, "rb") as raw:
+                truncated = os.fstat(raw.fileno()).st_size > LOG_TAIL_BYTES
+                if truncated:
+                    raw.seek(-LOG_TAIL_BYTES, os.SEEK_END)
+                
+                with io.TextIOWrapper(raw, encoding=TEXT_ENCODING, errors="replace") as f:
+                    if truncated:
+                        f.readline()  # Skip the partial first line
+                        text_widget.insert(tk.END, "...(truncated, showing the end of the log)...\n")
+                    
+                    i = 0
+                    while True:
+                        buf = f.read(LOG_CHUNK_SIZE)
+                        if not buf:
+                            break
+                        text_widget.insert(tk.END, buf)
+                        i += 1
+                        if i % 16 == 0:
+                            text_widget.update_idletasks()
+            text_widget.see(tk.END)
         except Exception as e:
-            mysql_log.insert(tk.END, f"Could not read MySQL error log: {str(e)}")
+            text_widget.insert(tk.END, f"Could not read {name} error log: {str(e)}")
 
 def main():
     # Check if running as root (not recommended for GUI apps)
@@ -501,6 +775,7 @@ def main():
     
     # Handle window closing
     def on_closing():
+        app.shutdown()
         root.quit()
         root.destroy()
     